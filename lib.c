@@ -1,3 +1,6 @@
+// needed for mmap and sigaction, since we compile with -std=c99
+#define _DEFAULT_SOURCE
+
 #include <errno.h>
 #include <stdarg.h>
 #include <stdbool.h>
@@ -12,7 +15,15 @@
 #endif
 
 #if defined(IS_POSIX)
+#include <signal.h>
+#include <sys/mman.h>
 #include <sys/stat.h>
+#include <sys/wait.h>
+#include <unistd.h>
+
+#if !defined(MAP_ANONYMOUS) && defined(MAP_ANON)
+#define MAP_ANONYMOUS MAP_ANON
+#endif
 #endif
 
 #define DEBUG_ASSERT 1
@@ -32,6 +43,17 @@ size_t ptr_to_int(void *ptr);
 void *int_to_ptr(size_t i);
 void get_sys(bool *is_linux, bool *is_darwin, bool *is_win32);
 int32_t get_errno(void);
+size_t write_stdout(char const *data, size_t len);
+bool write_file(char const *path, char const *data, size_t len);
+char *read_file(char const *path, size_t *len);
+void *alloc_guarded_stack(size_t size);
+void free_guarded_stack(void *stack, size_t size);
+bool jit_supported(void);
+void *alloc_code(size_t size);
+bool protect_code(void *code, size_t size);
+void free_code(void *code, size_t size);
+char const *c_compiler(void);
+int32_t run_with_input(char *const *argv, char const *input, size_t len);
 
 char const *get_stdlib_directory() {
     return STDLIB_DIR;
@@ -153,3 +175,250 @@ void get_os(int32_t *os) {
 int32_t get_errno() {
     return errno;
 }
+
+size_t write_stdout(char const *data, size_t len) {
+    return fwrite(data, 1, len, stdout);
+}
+
+// returns false if the file could not be written completely
+bool write_file(char const *path, char const *data, size_t len) {
+    FILE *f = fopen(path, "wb");
+    if (f == NULL) {
+        return false;
+    }
+
+    bool ok = fwrite(data, 1, len, f) == len;
+    return fclose(f) == 0 && ok;
+}
+
+// reads the whole file into a malloc'd buffer, returns NULL on error
+char *read_file(char const *path, size_t *len) {
+    FILE *f = fopen(path, "rb");
+    if (f == NULL) {
+        return NULL;
+    }
+
+    char *data = NULL;
+    long size = -1;
+    if (fseek(f, 0, SEEK_END) == 0) {
+        size = ftell(f);
+    }
+
+    if (size >= 0 && fseek(f, 0, SEEK_SET) == 0) {
+        // malloc(0) may return NULL
+        data = malloc((size_t)size + 1);
+    }
+
+    if (data != NULL && fread(data, 1, (size_t)size, f) != (size_t)size) {
+        free(data);
+        data = NULL;
+    }
+
+    fclose(f);
+    *len = (size_t)size;
+    return data;
+}
+
+#if defined(IS_POSIX)
+// the guard page of the most recently allocated stack
+static char *guard_page = NULL;
+static size_t guard_page_size = 0;
+
+// the handler, which was installed before on_segfault
+static struct sigaction previous_segfault_action;
+static bool segfault_handler_installed = false;
+
+// The guard page is only a backstop: the vm checks the stack in EnterFunction and reports the
+// function and call depth itself (see Trap.StackOverflow), so only pushes beyond the reserved
+// operand stack end up here. The vm state is not known in the handler, so the message is generic
+static void on_segfault(int sig, siginfo_t *info, void *context) {
+    char *addr = info->si_addr;
+    if (guard_page != NULL && addr >= guard_page && addr < guard_page + guard_page_size) {
+        static char const msg[] = "error: vm stack overflow\n";
+        write(STDERR_FILENO, msg, sizeof msg - 1);
+        _exit(1);
+    }
+
+    // not our fault, pass it on to the previous handler
+    if (previous_segfault_action.sa_flags & SA_SIGINFO) {
+        previous_segfault_action.sa_sigaction(sig, info, context);
+        return;
+    }
+    if (previous_segfault_action.sa_handler != SIG_DFL && previous_segfault_action.sa_handler != SIG_IGN) {
+        previous_segfault_action.sa_handler(sig);
+        return;
+    }
+
+    // or crash like we normally would
+    sigaction(sig, &previous_segfault_action, NULL);
+    raise(sig);
+}
+#endif
+
+// the vm stack grows upwards, so an inaccessible guard page is placed directly after it. Running
+// into the guard page reports a stack overflow instead of corrupting the memory behind the stack
+// returns NULL if the stack could not be allocated
+void *alloc_guarded_stack(size_t size) {
+#if defined(IS_POSIX)
+    size_t page = (size_t)sysconf(_SC_PAGESIZE);
+    size_t usable = (size + page - 1) / page * page;
+
+    char *stack = mmap(NULL, usable + page, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    if (stack == MAP_FAILED) {
+        return NULL;
+    }
+
+    if (mprotect(stack + usable, page, PROT_NONE) != 0) {
+        munmap(stack, usable + page);
+        return NULL;
+    }
+
+    guard_page = stack + usable;
+    guard_page_size = page;
+
+    if (!segfault_handler_installed) {
+        struct sigaction action;
+        memset(&action, 0, sizeof action);
+        action.sa_sigaction = on_segfault;
+        action.sa_flags = SA_SIGINFO;
+        sigemptyset(&action.sa_mask);
+        if (sigaction(SIGSEGV, &action, &previous_segfault_action) == 0) {
+            segfault_handler_installed = true;
+        }
+    }
+
+    return stack;
+#else
+    return malloc(size);
+#endif
+}
+
+void free_guarded_stack(void *stack, size_t size) {
+#if defined(IS_POSIX)
+    if (stack == NULL) {
+        return;
+    }
+
+    size_t page = (size_t)sysconf(_SC_PAGESIZE);
+    size_t usable = (size + page - 1) / page * page;
+    if (guard_page == (char *)stack + usable) {
+        guard_page = NULL;
+    }
+    munmap(stack, usable + page);
+#else
+    free(stack);
+#endif
+}
+
+// the jit of the vm generates x86-64 code for the System V ABI
+bool jit_supported(void) {
+#if defined(IS_POSIX) && defined(__x86_64__) && (defined(linux) || defined(__linux__))
+    return true;
+#else
+    return false;
+#endif
+}
+
+// memory for the code of the jit, it is writable until protect_code makes it executable
+// returns NULL if the memory could not be allocated
+void *alloc_code(size_t size) {
+#if defined(IS_POSIX)
+    void *code = mmap(NULL, size, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    if (code == MAP_FAILED) {
+        return NULL;
+    }
+    return code;
+#else
+    (void)size;
+    return NULL;
+#endif
+}
+
+bool protect_code(void *code, size_t size) {
+#if defined(IS_POSIX)
+    return mprotect(code, size, PROT_READ | PROT_EXEC) == 0;
+#else
+    (void)code;
+    (void)size;
+    return false;
+#endif
+}
+
+void free_code(void *code, size_t size) {
+#if defined(IS_POSIX)
+    munmap(code, size);
+#else
+    (void)code;
+    (void)size;
+#endif
+}
+
+// the C compiler used by the c backend, $CC if it is set
+char const *c_compiler(void) {
+    char const *cc = getenv("CC");
+    if (cc == NULL || *cc == '\0') {
+        return "cc";
+    }
+    return cc;
+}
+
+// runs argv[0] (searched in PATH) with the NULL terminated arguments argv and writes input to its
+// stdin. Returns the exit code of the process or -1 if it could not be run
+int32_t run_with_input(char *const *argv, char const *input, size_t len) {
+#if defined(IS_POSIX)
+    int fds[2];
+    if (pipe(fds) != 0) {
+        return -1;
+    }
+
+    pid_t pid = fork();
+    if (pid < 0) {
+        close(fds[0]);
+        close(fds[1]);
+        return -1;
+    }
+
+    if (pid == 0) {
+        dup2(fds[0], STDIN_FILENO);
+        close(fds[0]);
+        close(fds[1]);
+        execvp(argv[0], argv);
+        _exit(127);
+    }
+
+    close(fds[0]);
+
+    // the process may exit before it read everything, which must not kill the compiler
+    void (*previous)(int) = signal(SIGPIPE, SIG_IGN);
+    size_t written = 0;
+    while (written < len) {
+        ssize_t n = write(fds[1], input + written, len - written);
+        if (n < 0 && errno == EINTR) {
+            continue;
+        }
+        if (n <= 0) {
+            break;
+        }
+        written += (size_t)n;
+    }
+    close(fds[1]);
+    signal(SIGPIPE, previous);
+
+    int status = 0;
+    while (waitpid(pid, &status, 0) < 0) {
+        if (errno != EINTR) {
+            return -1;
+        }
+    }
+
+    if (!WIFEXITED(status) || WEXITSTATUS(status) == 127) {
+        return -1;
+    }
+    return WEXITSTATUS(status);
+#else
+    (void)argv;
+    (void)input;
+    (void)len;
+    return -1;
+#endif
+}
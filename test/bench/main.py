@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# Runs the vm benchmarks in bench/cases and compares them against a stored baseline
+# Every benchmark is compiled into a bytecode image (.kbc) once, only running the image is timed
+# The number of executed instructions is deterministic, so it is compared strictly by default, the
+# wall time gets a more generous threshold
+
+import argparse
+import json
+import subprocess
+import tempfile
+import time
+from os import listdir
+from os.path import abspath, basename, dirname, isfile, join, splitext
+from typing import Dict, List, Optional
+
+instructions_prefix = 'instructions executed: '
+
+
+class Measurement(object):
+    def __init__(self, instructions: int, seconds: float):
+        self.instructions = instructions
+        self.seconds = seconds
+
+    def to_json(self) -> Dict:
+        return {'instructions': self.instructions, 'seconds': round(self.seconds, 4)}
+
+    @staticmethod
+    def from_json(data: Dict) -> 'Measurement':
+        return Measurement(data['instructions'], data['seconds'])
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def main():
+    bench_dir = dirname(abspath(__file__))
+
+    parser = argparse.ArgumentParser(
+        description='The Kantan vm benchmark runner',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+
+    parser.add_argument('compiler', type=str, help='path to the compiler executable')
+    parser.add_argument('--benchmarks', type=str, default=join(bench_dir, 'cases'),
+                        help='path to the benchmark programs directory')
+    parser.add_argument('--baseline', type=str, default=join(bench_dir, 'baseline.json'),
+                        help='path to the baseline file')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the measurements to the baseline instead of comparing them')
+    parser.add_argument('--runs', type=int, default=5, help='number of runs per benchmark, the fastest is used')
+    parser.add_argument('--max-time-regression', type=float, default=0.10,
+                        help='allowed relative increase of the wall time')
+    parser.add_argument('--max-instruction-regression', type=float, default=0.0,
+                        help='allowed relative increase of the executed instructions')
+    parser.add_argument('--vm-encoding', type=str, default=None, help='passed to the compiler')
+    parser.add_argument('--cases', nargs='+', help='benchmarks to run (if empty, all benchmarks will be executed)')
+
+    args = parser.parse_args()
+
+    files = args.cases if args.cases is not None else read(args.benchmarks)
+    options = []
+    if args.vm_encoding is not None:
+        options += ['--vm-encoding', args.vm_encoding]
+
+    # the baseline is checked first, so a missing one does not wait for all benchmarks
+    baseline = None
+    if not args.update_baseline:
+        try:
+            baseline = read_baseline(args.baseline)
+        except BenchmarkError as e:
+            print(e)
+            exit(1)
+
+    measurements = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for file in files:
+            try:
+                image = compile_image(args.compiler, file, options, directory)
+                measurements[basename(file)] = measure(args.compiler, image, args.runs)
+            except BenchmarkError as e:
+                print(f'{basename(file)}: {e}')
+                exit(1)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({name: m.to_json() for name, m in sorted(measurements.items())}, f, indent=4)
+            f.write('\n')
+        print(f'wrote {len(measurements)} measurements to {args.baseline}')
+        exit(0)
+
+    regressions = report(measurements, baseline, args.max_instruction_regression, args.max_time_regression)
+    if regressions > 0:
+        print(f'{regressions} regression(s)')
+        exit(1)
+
+
+def read(bench_path: str) -> List[str]:
+    return sorted(join(bench_path, f) for f in listdir(bench_path) if splitext(f)[1] == '.kan')
+
+
+def read_baseline(path: str) -> Dict[str, Measurement]:
+    if not isfile(path):
+        raise BenchmarkError(f'no baseline at {path}, create one with --update-baseline')
+
+    with open(path) as f:
+        return {name: Measurement.from_json(data) for name, data in json.load(f).items()}
+
+
+# compiles file into a bytecode image in directory and returns its path
+def compile_image(compiler: str, file: str, options: List[str], directory: str) -> str:
+    image = join(directory, splitext(basename(file))[0] + '.kbc')
+    completed = subprocess.run([compiler] + options + ['--emit-bytecode', image, file],
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if completed.returncode != 0 or not isfile(image):
+        output = completed.stdout.decode('utf-8', 'replace')
+        raise BenchmarkError(f'could not compile the benchmark ({completed.returncode})\n{output}')
+    return image
+
+
+# runs the image, so that the front end and the bytecode compiler are not part of the time
+def measure(compiler: str, image: str, runs: int) -> Measurement:
+    instructions = None
+    best = None
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run([compiler, '--vm-stats', image], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        elapsed = time.perf_counter() - start
+
+        stdout = completed.stdout.decode('utf-8', 'replace')
+        if completed.returncode != 0:
+            raise BenchmarkError(f'expected 0 as return code, but got {completed.returncode}\n{stdout}')
+
+        count = parse_instructions(stdout)
+        if count is None:
+            raise BenchmarkError('the compiler did not print the number of executed instructions')
+        if instructions is not None and instructions != count:
+            raise BenchmarkError(f'the number of executed instructions changed from {instructions} to {count}')
+
+        instructions = count
+        best = elapsed if best is None else min(best, elapsed)
+
+    return Measurement(instructions, best)
+
+
+def parse_instructions(stdout: str) -> Optional[int]:
+    for line in stdout.splitlines():
+        if line.startswith(instructions_prefix):
+            return int(line[len(instructions_prefix):])
+    return None
+
+
+def relative_change(old: float, new: float) -> float:
+    if old == 0:
+        return 0.0 if new == 0 else float('inf')
+    return (new - old) / old
+
+
+# prints a table of all measurements and returns the number of regressions
+def report(measurements: Dict[str, Measurement], baseline: Dict[str, Measurement],
+           max_instruction_regression: float, max_time_regression: float) -> int:
+    regressions = 0
+
+    print(f'{"benchmark":<16}{"instructions":>16}{"change":>10}{"time":>10}{"change":>10}')
+    for name, m in measurements.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f'{name:<16}{m.instructions:>16}{"new":>10}{m.seconds:>9.3f}s{"new":>10}')
+            continue
+
+        instruction_change = relative_change(old.instructions, m.instructions)
+        time_change = relative_change(old.seconds, m.seconds)
+
+        marks = ''
+        if instruction_change > max_instruction_regression:
+            marks += ' instructions regressed'
+        if time_change > max_time_regression:
+            marks += ' time regressed'
+        if len(marks) > 0:
+            regressions += 1
+
+        print(f'{name:<16}{m.instructions:>16}{instruction_change:>+10.1%}'
+              f'{m.seconds:>9.3f}s{time_change:>+10.1%}{marks}')
+
+    return regressions
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+# Helpers for the bytecode dump, which --interpret prints in front of the '-----' line
+# Every instruction is a line of the form '<address> <mnemonic> [<operand>...]'
+
+from typing import List
+
+SEPARATOR = '-----'
+
+
+# the dump of the bytecode without the output of the vm
+def bytecode_dump(output: str) -> str:
+    return output.split(SEPARATOR)[0]
+
+
+# the mnemonics of the dumped instructions in the order of their addresses
+def bytecode_mnemonics(output: str) -> List[str]:
+    return [line.split()[1] for line in bytecode_dump(output).splitlines() if line.strip()]
@@ -0,0 +1,38 @@
+import os
+import shutil
+import subprocess
+from typing import Optional, Union
+
+from runner.execute import ExecutionError, NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# the program is compiled through the c backend and the resulting executable is run
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor))
+        self.executable = self.base_filename() + '.out'
+        self.options = ['--backend', 'c', '-O', '2', '--out', self.executable]
+
+    def run(self) -> Union[None, int, ExecutionError]:
+        if shutil.which(os.environ.get('CC', 'cc')) is None:
+            return None
+
+        try:
+            output = super().run()
+            if type(output) is ExecutionError:
+                return output
+
+            if not os.path.exists(self.executable):
+                return ExecutionError('no executable was written', output)
+
+            return subprocess.run([self.executable]).returncode
+        finally:
+            if os.path.exists(self.executable):
+                os.remove(self.executable)
+
+    def test_output(self, output: int) -> Optional[TestError]:
+        if output != 42:
+            return expected_but_got('exit code', 42, output)
+
+        return None
@@ -14,12 +14,19 @@ OPTIONS:
     --help / -h               print this help text
     --debug-symbols / -g      enable debug symbols in the output
     --interpret / -i          interpret the compiled code
+    --emit-bytecode <file>    write the bytecode to a file               (.kbc files can be run like source files)
+    --vm-stack-size <bytes>   the stack size of the interpreter
+    --vm-encoding <encoding>  the operand layout of the bytecode         [possible values: aligned, packed] (aligned operands are faster to decode)
+    --vm-stats                print statistics of the interpreter
+    --jit                     compile hot functions to machine code      (only on x86-64 linux)
+    --backend <backend>       compile the program into native code       [possible values: c, x86-64] (c uses the system C compiler)
     --mi                      enable the machine interface               (output everything as json)
     --dump-ast                dump the ast as json                       (needs --mi)
     --dump-config             dump the compiler config as json           (needs --mi)
     --dump-call-graph         dump the call-graph as json                (needs --mi)
     --dump-type-graph         dump the type-graph as json                (needs --mi)
     --dump-ir                 dump the ir as json                        (needs --mi)
+    --dump-ir-format <format> the encoding used by --dump-ir             [possible values: json, binary] (binary is written without --mi)
     --parse-only              quit after parsing
     --opt-level / -O <level>  the optimization level                     [possible values: 0, 1, 2, 3]
     --out / -o <file>         the output file                            (end with .s/.o for assembly/obj-file output)
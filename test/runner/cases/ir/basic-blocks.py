@@ -9,7 +9,7 @@ expected_ir = [{
         {
             'kind': 'definition',
             'original_name': 'main',
-            'mangled_name': '',
+            'mangled_name': '_K0_main',
             'ty': 'def main() -> i32',
             'locals': [
                 {
@@ -0,0 +1,38 @@
+from typing import Optional, Union
+
+from runner.execute import BinaryIRExecutor, ExecutionError
+from runner.output import Output
+from runner.testcase import SuccessTestCase, TestError, expected_but_got
+
+
+# the binary ir has to decode to exactly the same ir as the json output
+class Test(SuccessTestCase):
+    def __init__(self, executor):
+        super().__init__(executor, ['--mi', '--dump-ir'])
+        self.binary_executor = BinaryIRExecutor(executor)
+
+    def run(self) -> Union[Output, ExecutionError]:
+        output = super().run()
+        if type(output) is not Output:
+            return output
+
+        binary = self.binary_executor.run(
+            self.base_filename(),
+            self.files(),
+            ['--dump-ir', '--dump-ir-format', 'binary']
+        )
+        if type(binary) is ExecutionError:
+            return binary
+
+        output.binary_ir = [module.to_json() for module in binary]
+        return output
+
+    def test_output(self, output: Output) -> Optional[TestError]:
+        error = super().test_output(output)
+        if error is not None:
+            return error
+
+        if output.ir != output.binary_ir:
+            return expected_but_got('binary ir', output.ir, output.binary_ir)
+
+        return None
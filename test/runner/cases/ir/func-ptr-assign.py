@@ -124,100 +124,10 @@ expected_output = {
     'ir': [{
         'path': kantan_filename(__file__),
         'functions': [
-            {
-                "kind": "definition",
-                "original_name": "main",
-                "mangled_name": "",
-                "ty": "def main() -> void",
-                "locals": [
-                    {
-                        "name": "_1",
-                        "type": "(i32) -> i32",
-                        "temp": False
-                    }
-                ],
-                "blocks": {
-                    "bb0": {
-                        "statements": [
-                            {
-                                "kind": "assignment",
-                                "location": {
-                                    "kind": "local",
-                                    "name": "_1",
-                                    "temp": False,
-                                    "projections": []
-                                },
-                                "value": {
-                                    "kind": "use",
-                                    "operand": {
-                                        "kind": "constant",
-                                        "type": "(i32) -> i32",
-                                        "value": {
-                                            "kind": "function",
-                                            "name": "f",
-                                            "declared_in": kantan_filename(__file__)
-                                        }
-                                    }
-                                }
-                            },
-                            {
-                                "kind": "assignment",
-                                "location": {
-                                    "kind": "local",
-                                    "name": "_1",
-                                    "temp": False,
-                                    "projections": []
-                                },
-                                "value": {
-                                    "kind": "use",
-                                    "operand": {
-                                        "kind": "constant",
-                                        "type": "(i32) -> i32",
-                                        "value": {
-                                            "kind": "function",
-                                            "name": "g",
-                                            "declared_in": kantan_filename(__file__)
-                                        }
-                                    }
-                                }
-                            },
-                            {
-                                "kind": "assignment",
-                                "location": {
-                                    "kind": "local",
-                                    "name": "_1",
-                                    "temp": False,
-                                    "projections": []
-                                },
-                                "value": {
-                                    "kind": "use",
-                                    "operand": {
-                                        "kind": "constant",
-                                        "type": "(i32) -> i32",
-                                        "value": {
-                                            "kind": "function",
-                                            "name": "f",
-                                            "declared_in": kantan_filename(__file__)
-                                        }
-                                    }
-                                }
-                            }
-                        ],
-                        "terminator": {
-                            "kind": "return",
-                            "operand": {
-                                "kind": "constant",
-                                "type": "void",
-                                "value": None
-                            }
-                        }
-                    }
-                }
-            },
             {
                 "kind": "definition",
                 "original_name": "f",
-                "mangled_name": "",
+                "mangled_name": "_K0_f",
                 "ty": "def f(i32) -> i32",
                 "locals": [
                     {
@@ -247,7 +157,7 @@ expected_output = {
             {
                 "kind": "definition",
                 "original_name": "g",
-                "mangled_name": "",
+                "mangled_name": "_K0_g",
                 "ty": "def g(i32) -> i32",
                 "locals": [
                     {
@@ -309,6 +219,96 @@ expected_output = {
                         }
                     }
                 }
+            },
+            {
+                "kind": "definition",
+                "original_name": "main",
+                "mangled_name": "_K0_main",
+                "ty": "def main() -> void",
+                "locals": [
+                    {
+                        "name": "_1",
+                        "type": "(i32) -> i32",
+                        "temp": False
+                    }
+                ],
+                "blocks": {
+                    "bb0": {
+                        "statements": [
+                            {
+                                "kind": "assignment",
+                                "location": {
+                                    "kind": "local",
+                                    "name": "_1",
+                                    "temp": False,
+                                    "projections": []
+                                },
+                                "value": {
+                                    "kind": "use",
+                                    "operand": {
+                                        "kind": "constant",
+                                        "type": "(i32) -> i32",
+                                        "value": {
+                                            "kind": "function",
+                                            "name": "f",
+                                            "declared_in": kantan_filename(__file__)
+                                        }
+                                    }
+                                }
+                            },
+                            {
+                                "kind": "assignment",
+                                "location": {
+                                    "kind": "local",
+                                    "name": "_1",
+                                    "temp": False,
+                                    "projections": []
+                                },
+                                "value": {
+                                    "kind": "use",
+                                    "operand": {
+                                        "kind": "constant",
+                                        "type": "(i32) -> i32",
+                                        "value": {
+                                            "kind": "function",
+                                            "name": "g",
+                                            "declared_in": kantan_filename(__file__)
+                                        }
+                                    }
+                                }
+                            },
+                            {
+                                "kind": "assignment",
+                                "location": {
+                                    "kind": "local",
+                                    "name": "_1",
+                                    "temp": False,
+                                    "projections": []
+                                },
+                                "value": {
+                                    "kind": "use",
+                                    "operand": {
+                                        "kind": "constant",
+                                        "type": "(i32) -> i32",
+                                        "value": {
+                                            "kind": "function",
+                                            "name": "f",
+                                            "declared_in": kantan_filename(__file__)
+                                        }
+                                    }
+                                }
+                            }
+                        ],
+                        "terminator": {
+                            "kind": "return",
+                            "operand": {
+                                "kind": "constant",
+                                "type": "void",
+                                "value": None
+                            }
+                        }
+                    }
+                }
             }
         ]
     }]}
@@ -6,33 +6,10 @@ from runner.testcase import SuccessTestCase, TestError, expected_but_got, kantan
 expected_ir = [{
     'path': kantan_filename(__file__),
     'functions': [
-        {
-            'kind': 'definition',
-            'original_name': 'f',
-            'mangled_name': '',
-            'ty': 'def f() -> u32',
-            'locals': [],
-            'blocks': {
-                'bb0': {
-                    'statements': [],
-                    'terminator': {
-                        'kind': 'return',
-                        'operand': {
-                            'kind': 'constant',
-                            'type': 'u32',
-                            'value': {
-                                'kind': 'int',
-                                'value': 0
-                            }
-                        }
-                    }
-                }
-            }
-        },
         {
             'kind': 'definition',
             'original_name': 'main',
-            'mangled_name': '',
+            'mangled_name': '_K0_main',
             'ty': 'def main() -> void',
             'locals': [
                 {
@@ -241,6 +218,29 @@ expected_ir = [{
                 }
             }
         },
+        {
+            'kind': 'definition',
+            'original_name': 'f',
+            'mangled_name': '_K0_f',
+            'ty': 'def f() -> u32',
+            'locals': [],
+            'blocks': {
+                'bb0': {
+                    'statements': [],
+                    'terminator': {
+                        'kind': 'return',
+                        'operand': {
+                            'kind': 'constant',
+                            'type': 'u32',
+                            'value': {
+                                'kind': 'int',
+                                'value': 0
+                            }
+                        }
+                    }
+                }
+            }
+        },
     ]
 }]
 
@@ -9,7 +9,7 @@ expected_ir = [{
         {
             'kind': 'definition',
             'original_name': 'f',
-            'mangled_name': '',
+            'mangled_name': '_K0_f',
             'ty': 'def f(bool, bool, bool) -> i32',
             'locals': [
                 {
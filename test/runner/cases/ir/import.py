@@ -10,7 +10,7 @@ expected_ir = [
             {
                 'kind': 'definition',
                 'original_name': 'main',
-                'mangled_name': '',
+                'mangled_name': '_K0_main',
                 'ty': 'def main() -> void',
                 'locals': [],
                 'blocks': {
@@ -35,7 +35,7 @@ expected_ir = [
             {
                 'kind': 'definition',
                 'original_name': 'some_function',
-                'mangled_name': '',
+                'mangled_name': '_K1_some_function',
                 'ty': 'def some_function() -> i32',
                 'locals': [],
                 'blocks': {
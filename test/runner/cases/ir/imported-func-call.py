@@ -7,33 +7,10 @@ expected_ir = [
     {
         "path": kantan_filename(__file__),
         "functions": [
-            {
-                "kind": "definition",
-                "original_name": "some_function",
-                "mangled_name": "",
-                "ty": "def some_function() -> i32",
-                "locals": [],
-                "blocks": {
-                    "bb0": {
-                        "statements": [],
-                        "terminator": {
-                            "kind": "return",
-                            "operand": {
-                                "kind": "constant",
-                                "type": "i32",
-                                "value": {
-                                    "kind": "int",
-                                    "value": 0
-                                }
-                            }
-                        }
-                    }
-                }
-            },
             {
                 "kind": "definition",
                 "original_name": "main",
-                "mangled_name": "",
+                "mangled_name": "_K0_main",
                 "ty": "def main() -> i32",
                 "locals": [
                     {
@@ -147,6 +124,29 @@ expected_ir = [
                         }
                     }
                 }
+            },
+            {
+                "kind": "definition",
+                "original_name": "some_function",
+                "mangled_name": "_K0_some_function",
+                "ty": "def some_function() -> i32",
+                "locals": [],
+                "blocks": {
+                    "bb0": {
+                        "statements": [],
+                        "terminator": {
+                            "kind": "return",
+                            "operand": {
+                                "kind": "constant",
+                                "type": "i32",
+                                "value": {
+                                    "kind": "int",
+                                    "value": 0
+                                }
+                            }
+                        }
+                    }
+                }
             }
         ]
     },
@@ -156,7 +156,7 @@ expected_ir = [
             {
                 "kind": "definition",
                 "original_name": "some_function",
-                "mangled_name": "",
+                "mangled_name": "_K1_some_function",
                 "ty": "def some_function() -> i32",
                 "locals": [],
                 "blocks": {
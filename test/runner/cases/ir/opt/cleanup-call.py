@@ -0,0 +1,16 @@
+from typing import Optional
+
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# a call returns to its next block, even if the cleanup moved it away from the call
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '-O', '1'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 1\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 1', output)
+
+        return None
@@ -0,0 +1,98 @@
+from typing import Optional
+
+from runner.output import Output
+from runner.testcase import SuccessTestCase, TestError, expected_but_got, kantan_filename
+
+# the else block is unreachable, the remaining blocks are merged into one and the unused temporary
+# for 'x + 1' is removed together with its local
+expected_ir = [{
+    'path': kantan_filename(__file__),
+    'functions': [
+        {
+            'kind': 'definition',
+            'original_name': 'main',
+            'mangled_name': '_K0_main',
+            'ty': 'def main() -> i32',
+            'locals': [
+                {
+                    'name': '_1',
+                    'type': 'i32',
+                    'temp': False
+                },
+            ],
+            'blocks': {
+                'bb0': {
+                    'statements': [
+                        {
+                            'kind': 'assignment',
+                            'location': {
+                                'kind': 'local',
+                                'name': '_1',
+                                'temp': False,
+                                'projections': []
+                            },
+                            'value': {
+                                'kind': 'use',
+                                'operand': {
+                                    'kind': 'constant',
+                                    'type': 'i32',
+                                    'value': {
+                                        'kind': 'int',
+                                        'value': 1
+                                    }
+                                }
+                            }
+                        },
+                        {
+                            'kind': 'assignment',
+                            'location': {
+                                'kind': 'local',
+                                'name': '_1',
+                                'temp': False,
+                                'projections': []
+                            },
+                            'value': {
+                                'kind': 'use',
+                                'operand': {
+                                    'kind': 'constant',
+                                    'type': 'i32',
+                                    'value': {
+                                        'kind': 'int',
+                                        'value': 2
+                                    }
+                                }
+                            }
+                        },
+                    ],
+                    'terminator': {
+                        'kind': 'return',
+                        'operand': {
+                            'kind': 'copy',
+                            'location': {
+                                'kind': 'local',
+                                'name': '_1',
+                                'temp': False,
+                                'projections': []
+                            }
+                        }
+                    }
+                },
+            }
+        },
+    ]
+}]
+
+
+class Test(SuccessTestCase):
+    def __init__(self, executor):
+        super().__init__(executor)
+        self.options.extend(['--dump-ir', '-O', '1'])
+
+    def test_output(self, output: Output) -> Optional[TestError]:
+        super_error = super().test_output(output)
+        if super_error is not None:
+            return super_error
+
+        ir = output.ir
+        if ir != expected_ir:
+            return expected_but_got('ir', expected_ir, ir)
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from runner.bytecode import bytecode_mnemonics
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# add is inlined into twice first, then both are inlined into main, so the only call left is the
+# call of main. The arguments are assigned to the inlined parameters
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '-O', '2'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 13\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 13', output)
+
+        mnemonics = bytecode_mnemonics(output)
+        if mnemonics.count('call.direct') != 1:
+            return expected_but_got('only the call of main', 'call.direct', output)
+
+        return None
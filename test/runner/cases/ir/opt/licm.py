@@ -0,0 +1,16 @@
+from typing import Optional
+
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# the nested loops have to compute the same result after their invariant values were moved out
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '-O', '2'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 120\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 120', output)
+
+        return None
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# the loop has to compute the same result after its locals went through ssa and back
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '-O', '2'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 55\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 55', output)
+
+        return None
@@ -0,0 +1,50 @@
+from typing import Optional
+
+from runner.output import Output
+from runner.testcase import SuccessTestCase, TestError, expected_but_got, kantan_filename
+
+# x and y only ever hold constants, so their versions are propagated into 'x + y', which is folded
+# afterwards. No assignment and no local is left
+expected_ir = [{
+    'path': kantan_filename(__file__),
+    'functions': [
+        {
+            'kind': 'definition',
+            'original_name': 'main',
+            'mangled_name': '_K0_main',
+            'ty': 'def main() -> i32',
+            'locals': [],
+            'blocks': {
+                'bb0': {
+                    'statements': [],
+                    'terminator': {
+                        'kind': 'return',
+                        'operand': {
+                            'kind': 'constant',
+                            'type': 'i32',
+                            'value': {
+                                'kind': 'int',
+                                'value': 3
+                            }
+                        }
+                    }
+                },
+            }
+        },
+    ]
+}]
+
+
+class Test(SuccessTestCase):
+    def __init__(self, executor):
+        super().__init__(executor)
+        self.options.extend(['--dump-ir', '-O', '2'])
+
+    def test_output(self, output: Output) -> Optional[TestError]:
+        super_error = super().test_output(output)
+        if super_error is not None:
+            return super_error
+
+        ir = output.ir
+        if ir != expected_ir:
+            return expected_but_got('ir', expected_ir, ir)
@@ -6,18 +6,10 @@ from runner.testcase import SuccessTestCase, TestError, expected_but_got, kantan
 expected_ir = [{
     'path': kantan_filename(__file__),
     'functions': [
-        {
-            'kind': 'definition',
-            'original_name': 'f',
-            'mangled_name': '',
-            'ty': 'def f(i32) -> i32',
-            'locals': [],
-            'blocks': {}
-        },
         {
             'kind': 'definition',
             'original_name': 'main',
-            'mangled_name': '',
+            'mangled_name': '_K0_main',
             'ty': 'def main() -> void',
             'locals': [
                 {
@@ -125,6 +117,14 @@ expected_ir = [{
                 }
             }
         },
+        {
+            'kind': 'definition',
+            'original_name': 'f',
+            'mangled_name': '_K0_f',
+            'ty': 'def f(i32) -> i32',
+            'locals': [],
+            'blocks': {}
+        },
     ]
 }]
 
@@ -0,0 +1,41 @@
+import os
+from typing import Optional, Tuple, Union
+
+from runner.execute import ExecutionError, NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# running the written .kbc file has to behave exactly like --interpret, which additionally prints
+# the locals of main at the end
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor))
+        self.image = self.base_filename() + '.kbc'
+        self.options = ['--interpret', '--emit-bytecode', self.image]
+
+    def run(self) -> Union[Tuple[str, str], ExecutionError]:
+        interpreted = super().run()
+        if type(interpreted) is ExecutionError:
+            return interpreted
+
+        try:
+            from_image = self.executor.run(self.base_filename(), [self.image], [])
+        finally:
+            if os.path.exists(self.image):
+                os.remove(self.image)
+
+        if type(from_image) is ExecutionError:
+            return from_image
+
+        return interpreted, from_image
+
+    def test_output(self, output: Tuple[str, str]) -> Optional[TestError]:
+        interpreted, from_image = output
+
+        if 'main returned i32: 3\n' not in from_image:
+            return expected_but_got('return value', 'main returned i32: 3', from_image)
+
+        if not interpreted.startswith(from_image):
+            return expected_but_got('output', interpreted, from_image)
+
+        return None
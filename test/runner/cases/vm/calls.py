@@ -0,0 +1,25 @@
+from typing import Optional
+
+from runner.bytecode import bytecode_mnemonics
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# known functions are called directly, function pointers still go through the constant pool
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 4\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 4', output)
+
+        mnemonics = bytecode_mnemonics(output)
+        # the call of main and the call of one
+        if mnemonics.count('call.direct') != 2:
+            return expected_but_got('2 direct calls', 'call.direct', output)
+
+        if mnemonics.count('call') != 1:
+            return expected_but_got('1 call through a function pointer', 'call', output)
+
+        return None
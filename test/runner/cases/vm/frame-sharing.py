@@ -0,0 +1,23 @@
+from typing import Optional
+
+from runner.bytecode import bytecode_dump
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# a is dead once b is written and b is dead once c is written, so all three share one 4 byte slot
+# and the frame is 8 bytes instead of 16
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 7\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 7', output)
+
+        bytecode = bytecode_dump(output)
+        enter = [line.split() for line in bytecode.splitlines() if 'function.enter' in line]
+        if len(enter) != 1 or enter[0][-1] != '8':
+            return expected_but_got('a frame of 8 bytes', 'function.enter 8', bytecode)
+
+        return None
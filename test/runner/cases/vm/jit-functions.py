@@ -0,0 +1,43 @@
+import platform
+import re
+from typing import Optional, Tuple, Union
+
+from runner.execute import ExecutionError, NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# a function between others is compiled with the default (aligned) encoding, where the code of a
+# function starts with the padding in front of its enter instruction
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '--vm-stats', '--jit'])
+
+    def run(self) -> Union[None, Tuple[str, str], ExecutionError]:
+        # the jit only generates code for x86-64 linux
+        if platform.system() != 'Linux' or platform.machine() != 'x86_64':
+            return None
+
+        jit = super().run()
+        if type(jit) is ExecutionError:
+            return jit
+
+        interpreted = self.executor.run(self.base_filename(), self.files(), ['--interpret', '--vm-stats'])
+        if type(interpreted) is ExecutionError:
+            return interpreted
+
+        return jit, interpreted
+
+    def test_output(self, output: Tuple[str, str]) -> Optional[TestError]:
+        jit, interpreted = output
+
+        if 'main returned i32: 3000\n' not in jit:
+            return expected_but_got('return value', 'main returned i32: 3000', jit)
+
+        if 'main returned i32: 3000\n' not in interpreted:
+            return expected_but_got('return value', 'main returned i32: 3000', interpreted)
+
+        executed = [int(re.search(r'instructions executed: (\d+)', o).group(1)) for o in (jit, interpreted)]
+        if executed[0] >= executed[1]:
+            return expected_but_got('less interpreted instructions', f'< {executed[1]}', executed[0])
+
+        return None
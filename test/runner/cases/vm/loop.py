@@ -0,0 +1,22 @@
+from typing import Optional
+
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# the backward jump of the loop is close enough for the 1 byte form
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '--vm-stats'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 45\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 45', output)
+
+        if 'jmp.short' not in output:
+            return expected_but_got('a short jump', 'jmp.short', output)
+
+        if 'instructions executed: ' not in output:
+            return expected_but_got('statistics', 'instructions executed: ', output)
+
+        return None
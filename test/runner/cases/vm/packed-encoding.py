@@ -0,0 +1,16 @@
+from typing import Optional
+
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# the operands are not aligned at all in the packed encoding
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '--vm-encoding', 'packed'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i64: 10000000000\n' not in output:
+            return expected_but_got('return value', 'main returned i64: 10000000000', output)
+
+        return None
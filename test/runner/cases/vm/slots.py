@@ -0,0 +1,24 @@
+from typing import Optional
+
+from runner.bytecode import bytecode_dump
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# x never escapes and is accessed through its slot, y is only accessed through its address
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 9\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 9', output)
+
+        bytecode = bytecode_dump(output)
+        if 'i32.load.local' not in bytecode or 'i32.store.local' not in bytecode:
+            return expected_but_got('slot accesses', 'i32.load.local and i32.store.local', bytecode)
+
+        if 'localptr' not in bytecode:
+            return expected_but_got('the address of y', 'localptr', bytecode)
+
+        return None
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# the function of the overflow is named with the default (aligned) encoding, where the enter
+# instruction of a function is preceded by padding
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '--vm-stack-size', '4096'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        expected = 'stack overflow in _K0_recurse at call depth '
+        if expected not in output:
+            return expected_but_got('error', expected, output)
+
+        return None
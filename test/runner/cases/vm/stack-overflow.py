@@ -0,0 +1,20 @@
+from typing import Optional
+
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# unbounded recursion is stopped before the stack is exhausted
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret', '--vm-stack-size', '4096'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        expected = 'stack overflow in _K0_recurse at call depth '
+        if expected not in output:
+            return expected_but_got('error', expected, output)
+
+        if 'main returned' in output:
+            return expected_but_got('no return value', '', output)
+
+        return None
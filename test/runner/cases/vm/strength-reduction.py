@@ -0,0 +1,26 @@
+from typing import Optional
+
+from runner.bytecode import bytecode_mnemonics
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# multiplications, divisions and modulos by powers of two are replaced with cheaper instructions
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 347\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 347', output)
+
+        mnemonics = bytecode_mnemonics(output)
+        for expensive in ['imul', 'idiv', 'imod']:
+            if expensive in mnemonics:
+                return expected_but_got('no ' + expensive, 'lsh, rsh and bitand', output)
+
+        for cheap in ['lsh', 'rsh', 'bitand']:
+            if mnemonics.count(cheap) != 1:
+                return expected_but_got('1 ' + cheap, cheap, output)
+
+        return None
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from runner.bytecode import bytecode_mnemonics
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# a tail call into a function with a different number of arguments returns to the right frame
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 42\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 42', output)
+
+        mnemonics = bytecode_mnemonics(output)
+        if mnemonics.count('call.tail') != 1:
+            return expected_but_got('1 tail call', 'call.tail', output)
+
+        return None
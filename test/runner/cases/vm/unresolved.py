@@ -0,0 +1,20 @@
+from typing import Optional
+
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# calling a function, which is not part of the linked program, is an error instead of a call to 0
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        expected = 'unresolved function '
+        if expected not in output or 'missing' not in output:
+            return expected_but_got('error', expected + 'missing', output)
+
+        if 'main returned' in output:
+            return expected_but_got('no return value', '', output)
+
+        return None
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from runner.bytecode import bytecode_mnemonics
+from runner.execute import NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# only the frame of the function with an escaping local is zeroed on entry
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor), ['--interpret'])
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        if 'main returned i32: 11\n' not in output:
+            return expected_but_got('return value', 'main returned i32: 11', output)
+
+        mnemonics = bytecode_mnemonics(output)
+        if mnemonics.count('function.enter') != 1:
+            return expected_but_got('1 zeroed frame', 'function.enter', output)
+
+        if mnemonics.count('function.enter.nozero') != 1:
+            return expected_but_got('1 frame without zeroing', 'function.enter.nozero', output)
+
+        return None
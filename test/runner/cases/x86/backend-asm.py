@@ -0,0 +1,54 @@
+import os
+from typing import Optional, Union
+
+from runner.execute import ExecutionError, NonParsingExecutor
+from runner.testcase import TestCase, TestError, expected_but_got
+
+
+# --out with .s writes the assembly of the x86-64 backend without assembling it, so this runs on
+# every host, since the target is given explicitly
+class Test(TestCase):
+    def __init__(self, executor):
+        super().__init__(NonParsingExecutor(executor))
+        self.assembly = self.base_filename() + '.s'
+        self.options = ['--backend', 'x86-64', '--target', 'x86_64-unknown-linux-sysv', '--out', self.assembly]
+
+    def run(self) -> Union[str, ExecutionError]:
+        try:
+            output = super().run()
+            if type(output) is ExecutionError:
+                return output
+
+            if not os.path.exists(self.assembly):
+                return ExecutionError('no assembly was written', output)
+
+            with open(self.assembly) as f:
+                return f.read()
+        finally:
+            if os.path.exists(self.assembly):
+                os.remove(self.assembly)
+
+    def test_output(self, output: str) -> Optional[TestError]:
+        lines = [line.strip() for line in output.splitlines()]
+
+        expected = [
+            '.intel_syntax noprefix',
+            '_K0_add:',
+            '_K0_main:',
+            'call _K0_add',
+            '.globl main',
+            'main:',
+            'call _K0_main',
+        ]
+        for line in expected:
+            if line not in lines:
+                return expected_but_got('line', line, output)
+
+        # the body of add adds its two parameters in registers
+        add = lines[lines.index('_K0_add:'):lines.index('_K0_main:')]
+        if not any(line.startswith('add ') for line in add):
+            return expected_but_got('an add instruction in _K0_add', 'add', '\n'.join(add))
+        if 'ret' not in add:
+            return expected_but_got('a ret in _K0_add', 'ret', '\n'.join(add))
+
+        return None
@@ -3,6 +3,7 @@ import subprocess
 from pathlib import Path
 from typing import List, Optional, Union
 
+from runner.irbinary import FormatError, Module, load
 from runner.output import Output, parse_output
 
 error_rc = 255
@@ -101,3 +102,23 @@ class NonParsingExecutor(CompilerExecutor):
             return completed_process
 
         return completed_process.stdout.decode('utf-8')
+
+
+class BinaryIRExecutor(CompilerExecutor):
+    def __init__(self, base: CompilerExecutor):
+        super().__init__(base.compiler_path, base.valgrind_opts)
+
+    def run(self, filename: str, files: List[str], options: List[str]) -> Union[List[Module], ExecutionError]:
+        completed_process = self._run(filename, files, options)
+        if type(completed_process) is ExecutionError:
+            return completed_process
+
+        raw_stdout = completed_process.stdout
+        if completed_process.returncode != 0:
+            return ExecutionError(f'expected 0 as return code, but got {completed_process.returncode}',
+                                  raw_stdout.decode('utf-8', 'replace'))
+
+        try:
+            return load(raw_stdout)
+        except (FormatError, IndexError, UnicodeDecodeError) as e:
+            return ExecutionError(f'could not decode binary ir: {e}', raw_stdout.decode('utf-8', 'replace'))
@@ -0,0 +1,246 @@
+# Reader for the binary ir format, which is produced by using the '--dump-ir --dump-ir-format binary'
+# flags. The layout is described in src/ir/encode.kan
+# The functions of a module are only decoded when they are accessed. The decoded functions have
+# exactly the same structure as the functions inside of the json ir output
+
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+MAGIC = b'KIR'
+VERSION = 1
+
+_function_kinds = ('declaration', 'definition')
+_unary_kinds = ('~', '-')
+
+
+class FormatError(Exception):
+    pass
+
+
+def is_binary_ir(data: bytes) -> bool:
+    return data[:len(MAGIC)] == MAGIC
+
+
+def load(data: bytes) -> List['Module']:
+    if not is_binary_ir(data):
+        raise FormatError('not a binary ir file')
+
+    reader = _Reader(data, len(MAGIC))
+    version = reader.byte()
+    if version != VERSION:
+        raise FormatError(f'unsupported binary ir version {version}, expected {VERSION}')
+
+    return [Module.read(reader) for _ in range(reader.uvarint())]
+
+
+class Module(object):
+    def __init__(self, path: str, functions: 'LazyFunctions'):
+        self.path = path
+        self.functions = functions
+
+    @classmethod
+    def read(cls, reader: '_Reader'):
+        path = reader.text()
+
+        spans = []
+        for _ in range(reader.uvarint()):
+            length = reader.uvarint()
+            spans.append((reader.pos, reader.pos + length))
+            reader.pos += length
+
+        return cls(path, LazyFunctions(reader.data, spans))
+
+    def to_json(self) -> dict:
+        return {'path': self.path, 'functions': list(self.functions)}
+
+
+class LazyFunctions(Sequence):
+    def __init__(self, data: bytes, spans: List[Tuple[int, int]]):
+        self._data = data
+        self._spans = spans
+        self._decoded: List[Optional[dict]] = [None] * len(spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        if self._decoded[idx] is None:
+            start, end = self._spans[idx]
+            reader = _Reader(self._data, start)
+            self._decoded[idx] = reader.function()
+            if reader.pos != end:
+                raise FormatError(f'function {idx} has an invalid length')
+
+        return self._decoded[idx]
+
+    def names(self) -> List[str]:
+        # only the kind and the name are decoded here
+        names = []
+        for start, _ in self._spans:
+            reader = _Reader(self._data, start + 1)
+            names.append(reader.text())
+        return names
+
+    def find(self, original_name: str) -> Optional[dict]:
+        for idx, name in enumerate(self.names()):
+            if name == original_name:
+                return self[idx]
+        return None
+
+
+class _Reader(object):
+    def __init__(self, data: bytes, pos: int):
+        self.data = data
+        self.pos = pos
+
+    def byte(self) -> int:
+        b = self.data[self.pos]
+        self.pos += 1
+        return b
+
+    def boolean(self) -> bool:
+        return self.byte() != 0
+
+    def uvarint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            b = self.data[self.pos]
+            self.pos += 1
+            result |= (b & 0x7f) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+
+    def svarint(self) -> int:
+        value = self.uvarint()
+        return (value >> 1) ^ -(value & 1)
+
+    def float(self) -> float:
+        value = struct.unpack_from('<d', self.data, self.pos)[0]
+        self.pos += 8
+        return value
+
+    def text(self) -> str:
+        length = self.uvarint()
+        start = self.pos
+        self.pos += length
+        return bytes(self.data[start:self.pos]).decode('utf-8')
+
+    def function(self) -> dict:
+        function = {
+            'kind': _function_kinds[self.byte()],
+            'original_name': self.text(),
+            'mangled_name': self.text(),
+            'ty': self.text()
+        }
+
+        if function['kind'] == 'declaration':
+            return function
+
+        function['locals'] = [
+            {'name': f'_{i + 1}', 'type': self.text(), 'temp': self.boolean()} for i in range(self.uvarint())
+        ]
+
+        blocks = {}
+        for i in range(self.uvarint()):
+            statements = [self.statement() for _ in range(self.uvarint())]
+            blocks[f'bb{i}'] = {'statements': statements, 'terminator': self.terminator()}
+        function['blocks'] = blocks
+
+        return function
+
+    def statement(self) -> dict:
+        kind = self.byte()
+        if kind == 0:
+            return {'kind': 'assignment', 'location': self.location(), 'value': self.expression()}
+        if kind == 1:
+            return {'kind': 'nop'}
+        raise FormatError(f'invalid statement kind {kind}')
+
+    def terminator(self) -> dict:
+        kind = self.byte()
+        if kind == 0:
+            return {'kind': 'nop'}
+        if kind == 1:
+            return {'kind': 'return', 'operand': self.operand()}
+        if kind == 2:
+            callee = self.operand()
+            args = [self.operand() for _ in range(self.uvarint())]
+            dest = self.location()
+            return {'kind': 'call', 'callee': callee, 'args': args, 'dest': dest, 'next': f'bb{self.uvarint()}'}
+        if kind == 3:
+            return {'kind': 'jmp', 'target': f'bb{self.uvarint()}'}
+        if kind == 4:
+            condition = self.operand()
+            cases = [{'value': self.svarint(), 'target': f'bb{self.uvarint()}'} for _ in range(self.uvarint())]
+            return {'kind': 'switch', 'condition': condition, 'cases': cases}
+        raise FormatError(f'invalid terminator kind {kind}')
+
+    def location(self) -> dict:
+        kind = self.byte()
+        if kind != 0:
+            raise FormatError(f'invalid location kind {kind}')
+
+        name = f'_{self.uvarint()}'
+        temp = self.boolean()
+
+        projections = []
+        for _ in range(self.uvarint()):
+            projection = self.byte()
+            if projection != 2:
+                raise FormatError(f'invalid projection kind {projection}')
+            projections.append({'kind': 'deref'})
+
+        return {'kind': 'local', 'name': name, 'temp': temp, 'projections': projections}
+
+    def expression(self) -> dict:
+        kind = self.byte()
+        if kind == 0:
+            return {'kind': 'use', 'operand': self.operand()}
+        if kind == 1:
+            return {'kind': 'ref', 'location': self.location()}
+        if kind == 3:
+            binary_kind = self.text()
+            return {'kind': 'binary', 'binary-kind': binary_kind, 'left': self.operand(), 'right': self.operand()}
+        if kind == 4:
+            unary_kind = self.text()
+            if unary_kind not in _unary_kinds:
+                raise FormatError(f'invalid unary kind {unary_kind}')
+            return {'kind': 'unary', 'unary-kind': unary_kind, 'operand': self.operand()}
+        raise FormatError(f'invalid expression kind {kind}')
+
+    def operand(self) -> dict:
+        kind = self.byte()
+        if kind == 0:
+            return {'kind': 'copy', 'location': self.location()}
+        if kind == 1:
+            ty = self.text()
+            return {'kind': 'constant', 'type': ty, 'value': self.constant()}
+        raise FormatError(f'invalid operand kind {kind}')
+
+    def constant(self) -> Optional[dict]:
+        kind = self.byte()
+        if kind == 0:
+            return None
+        if kind == 1:
+            return {'kind': 'null'}
+        if kind == 2:
+            return {'kind': 'undefined'}
+        if kind == 3:
+            return {'kind': 'char', 'value': self.svarint()}
+        if kind == 4:
+            return {'kind': 'int', 'value': self.svarint()}
+        if kind == 5:
+            return {'kind': 'float', 'value': self.float()}
+        if kind == 6:
+            return {'kind': 'string', 'value': self.text()}
+        if kind == 7:
+            return {'kind': 'bool', 'value': self.boolean()}
+        if kind == 8:
+            name = self.text()
+            return {'kind': 'function', 'name': name, 'declared_in': self.text()}
+        raise FormatError(f'invalid constant kind {kind}')
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# Compare the interpreter speed of the aligned and the packed bytecode encoding (--vm-encoding)
+# usage: tools/bench-encoding.py <compiler> [<file.kan>...]
+# Without files, the benchmark programs in test/bench/cases are used
+
+import subprocess
+import sys
+import time
+from glob import glob
+from os.path import basename, dirname, join, realpath
+
+encodings = ['aligned', 'packed']
+runs = 5
+
+
+def run_once(compiler: str, file: str, encoding: str) -> float:
+    start = time.perf_counter()
+    completed = subprocess.run([compiler, '--interpret', '--vm-encoding', encoding, file],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+
+    if completed.returncode != 0:
+        print(f'{file} failed with {completed.returncode} ({encoding})')
+        exit(-1)
+
+    return elapsed
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(f'usage: {sys.argv[0]} <compiler> [<file.kan>...]')
+        exit(-1)
+
+    compiler = sys.argv[1]
+    files = sys.argv[2:]
+    if len(files) == 0:
+        files = sorted(glob(join(dirname(realpath(__file__)), '..', 'test', 'bench', 'cases', '*.kan')))
+
+    print(f'{"program":<20}' + ''.join(f'{e:>12}' for e in encodings) + f'{"speedup":>12}')
+    for file in files:
+        # the best of n runs is the least noisy measurement
+        times = [min(run_once(compiler, file, e) for _ in range(runs)) for e in encodings]
+        speedup = times[1] / times[0]
+        print(f'{basename(file):<20}' + ''.join(f'{t:>11.3f}s' for t in times) + f'{speedup:>11.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Measure the throughput of the compiler front end on programs from programgen.py
+# Every phase is a separate compiler invocation:
+#   parse: --parse-only
+#   check: the full front end including the type checker and the ir generation
+#   ir:    additionally dumps the ir with --mi --dump-ir
+# The program is generated in several sizes (--scales), a falling lines/sec with growing size points
+# to a scan that is worse than linear
+#
+# usage: tools/frontendbench.py <compiler> [options]
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from os.path import dirname, join, realpath
+from typing import List, Tuple
+
+sys.path.insert(0, dirname(realpath(__file__)))
+import programgen
+
+phases = [
+    ('parse', ['--parse-only']),
+    ('check', []),
+    ('ir', ['--mi', '--dump-ir']),
+]
+
+
+# returns the wall time in seconds and the peak rss in KiB
+def run(cmd: List[str]) -> Tuple[float, int]:
+    # stderr goes to a file instead of a pipe, because nothing reads a pipe while wait4 blocks, so
+    # a full pipe would block the compiler forever
+    with tempfile.TemporaryFile() as stderr_file:
+        start = time.perf_counter()
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr_file)
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+
+        # wait4 already reaped the process
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if process.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode('utf-8', 'replace')
+            print(f'{" ".join(cmd)} failed with {process.returncode}\n{stderr}')
+            exit(-1)
+
+    # ru_maxrss is in KiB on linux, but in bytes on macOS
+    max_rss = usage.ru_maxrss
+    if sys.platform == 'darwin':
+        max_rss //= 1024
+
+    return elapsed, max_rss
+
+
+def main():
+    defaults = programgen.Config()
+    parser = argparse.ArgumentParser(
+        description='The Kantan front end benchmark',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+
+    parser.add_argument('compiler', type=str, help='path to the compiler executable')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 2, 4],
+                        help='the number of modules is multiplied with each of these')
+    parser.add_argument('--modules', type=int, default=defaults.modules, help='number of modules at scale 1')
+    parser.add_argument('--functions', type=int, default=defaults.functions, help='functions per module')
+    parser.add_argument('--runs', type=int, default=3, help='number of runs per phase, the fastest is used')
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='seed of the random generator')
+
+    args = parser.parse_args()
+
+    print(f'{"scale":>6}{"lines":>10}{"phase":>8}{"time":>10}{"lines/sec":>12}{"peak rss":>12}')
+    for scale in args.scales:
+        config = programgen.Config(modules=args.modules * scale, functions=args.functions, seed=args.seed)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = programgen.generate(directory, config)
+            lines = sum(programgen.count_lines(p) for p in paths)
+
+            for name, options in phases:
+                measurements = [run([args.compiler] + options + [paths[0]]) for _ in range(args.runs)]
+                elapsed = min(m[0] for m in measurements)
+                max_rss = max(m[1] for m in measurements)
+
+                print(f'{scale:>6}{lines:>10}{name:>8}{elapsed:>9.3f}s{lines / elapsed:>12.0f}'
+                      f'{max_rss / 1024:>9.1f}MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 # Parse and format the ir which can be produced by using the '--mi --dump-ir' flags
 # That ir is in json. This Script takes said json and prints the human readable ir format
+# The binary ir ('--dump-ir --dump-ir-format binary') is also accepted
 
 import json
 import sys
+from os.path import dirname, join, realpath
 
+sys.path.insert(0, join(dirname(realpath(__file__)), '..', 'test'))
+from runner import irbinary
 
-def main():
-    compiler_output = sys.stdin.read()
-    parsed = None
 
+def read_modules(compiler_output: bytes):
+    if irbinary.is_binary_ir(compiler_output):
+        try:
+            return [module.to_json() for module in irbinary.load(compiler_output)]
+        except irbinary.FormatError as e:
+            print('Could not parse binary ir:', e)
+            exit(-1)
+
+    parsed = None
     try:
         parsed = json.loads(compiler_output)
     except json.JSONDecodeError:
@@ -20,7 +30,11 @@ def main():
         print("No ir in compiler output")
         exit(-2)
 
-    modules = parsed['ir']
+    return parsed['ir']
+
+
+def main():
+    modules = read_modules(sys.stdin.buffer.read())
     for mod in modules:
         if 'path' not in mod or 'functions' not in mod:
             print('ir has invalid format')
@@ -134,6 +148,7 @@ if __name__ == '__main__':
         print('Convert the json formatted ir output of the kantan compiler into a human readable format')
         print('\nUSAGE:')
         print(f'    kantan myfile.kan --mi --dump-ir | {sys.argv[0]}')
+        print(f'    kantan myfile.kan --dump-ir --dump-ir-format binary | {sys.argv[0]}')
         exit(0)
 
     main()
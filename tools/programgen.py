@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# Generate large synthetic Kantan programs to measure how the front end scales
+# The program consists of a chain of modules (mod_0.kan imports mod_1.kan and so on), so the import
+# graph is as deep as there are modules. Every module additionally imports a few of the modules
+# after it, contains many functions with long expressions and calls templates with lots of
+# different types
+#
+# usage: tools/programgen.py <output directory> [options]
+# the generated program starts at <output directory>/mod_0.kan
+
+import argparse
+import os
+import random
+from os.path import join
+from typing import List
+
+# the types, which the templates are instantiated with
+template_types = [
+    'i8', 'i16', 'i32', 'i64', 'u8', 'u16', 'u32', 'u64', 'bool',
+    '*i8', '*i16', '*i32', '*i64', '*u8', '*u16', '*u32', '*u64', '*bool',
+    '**i8', '**i16', '**i32', '**i64', '**u8', '**u16', '**u32', '**u64', '**bool',
+]
+
+binary_operators = ['+', '-', '*', '&', '|', '^']
+
+
+class Config(object):
+    def __init__(self, modules: int = 50, functions: int = 100, imports: int = 3, templates: int = 4,
+                 instantiations: int = len(template_types), expression_length: int = 40, seed: int = 0):
+        self.modules = modules
+        self.functions = functions
+        self.imports = imports
+        self.templates = templates
+        self.instantiations = min(instantiations, len(template_types))
+        self.expression_length = expression_length
+        self.seed = seed
+
+
+def module_name(idx: int) -> str:
+    return f'mod_{idx}'
+
+
+def expression(rng: random.Random, length: int) -> str:
+    operands = ['a', 'b', 'x']
+    expr = rng.choice(operands)
+    for i in range(length):
+        operand = rng.choice(operands) if rng.random() < 0.5 else str(rng.randint(1, 1000))
+        expr = f'{expr} {rng.choice(binary_operators)} {operand}'
+
+        # nest some of the subexpressions
+        if i % 8 == 7:
+            expr = f'({expr})'
+
+    return expr
+
+
+def imported_modules(idx: int, config: Config) -> List[int]:
+    return [i for i in range(idx + 1, idx + 1 + config.imports) if i < config.modules]
+
+
+def function(rng: random.Random, idx: int, f: int, config: Config) -> str:
+    lines = [f'def f_{f}(a: i32, b: i32): i32 {{']
+    lines.append(f'    let x = {expression(rng, 2)};')
+    lines.append(f'    x = {expression(rng, config.expression_length)};')
+
+    if f > 0:
+        lines.append('    if x > b {')
+        lines.append(f'        x = f_{rng.randrange(f)}(x, a);')
+        lines.append('    }')
+
+    # every function calls into one of the imported modules
+    imports = imported_modules(idx, config)
+    if len(imports) > 0:
+        other = module_name(rng.choice(imports))
+        lines.append(f'    x = x + {other}.f_{rng.randrange(config.functions)}(b, x);')
+
+    lines.append('    return x;')
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def template_user(idx: int, config: Config) -> str:
+    # every template is called with every type, so there are templates * instantiations instances
+    lines = ['def use_templates() {']
+    for i, ty in enumerate(template_types[:config.instantiations]):
+        lines.append(f'    let v_{i}: {ty} = undefined;')
+        for t in range(config.templates):
+            lines.append(f'    v_{i} = id_{t}(v_{i});')
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def module(idx: int, config: Config) -> str:
+    rng = random.Random(config.seed * 1000003 + idx)
+
+    parts = []
+    imports = imported_modules(idx, config)
+    if len(imports) > 0:
+        parts.append('\n'.join(f'import "{module_name(i)}";' for i in imports))
+
+    if idx == 0:
+        parts.append('def main(): i32 {\n    use_templates();\n    return f_0(1, 2);\n}')
+
+    for t in range(config.templates):
+        parts.append(f'def [T] id_{t}(t: T): T {{\n    return t;\n}}')
+
+    parts.append(template_user(idx, config))
+    parts += [function(rng, idx, f, config) for f in range(config.functions)]
+
+    return '\n\n'.join(parts) + '\n'
+
+
+# writes the program and returns the paths of all modules
+def generate(directory: str, config: Config) -> List[str]:
+    os.makedirs(directory, exist_ok=True)
+
+    paths = []
+    for idx in range(config.modules):
+        path = join(directory, module_name(idx) + '.kan')
+        with open(path, 'w') as f:
+            f.write(module(idx, config))
+        paths.append(path)
+
+    return paths
+
+
+def main():
+    defaults = Config()
+    parser = argparse.ArgumentParser(
+        description='Generate large synthetic Kantan programs',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+
+    parser.add_argument('directory', type=str, help='the output directory')
+    parser.add_argument('--modules', type=int, default=defaults.modules, help='number of modules')
+    parser.add_argument('--functions', type=int, default=defaults.functions, help='functions per module')
+    parser.add_argument('--imports', type=int, default=defaults.imports, help='imports per module')
+    parser.add_argument('--templates', type=int, default=defaults.templates, help='templates per module')
+    parser.add_argument('--instantiations', type=int, default=defaults.instantiations,
+                        help='types each template is called with')
+    parser.add_argument('--expression-length', type=int, default=defaults.expression_length,
+                        help='number of binary operators in the long expressions')
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='seed of the random generator')
+
+    args = parser.parse_args()
+    config = Config(args.modules, args.functions, args.imports, args.templates, args.instantiations,
+                    args.expression_length, args.seed)
+
+    paths = generate(args.directory, config)
+    lines = sum(count_lines(p) for p in paths)
+    print(f'wrote {len(paths)} modules with {lines} lines, the root module is {paths[0]}')
+
+
+def count_lines(path: str) -> int:
+    with open(path) as f:
+        return sum(1 for _ in f)
+
+
+if __name__ == '__main__':
+    main()